@@ -1,8 +1,11 @@
 import tkinter as tk
 from PIL import Image, ImageTk, ImageSequence
-import random
 import pygame
 import os
+import time
+from quiz_engine import QuizSession, CORRECT, TRY_AGAIN, QUESTIONS_PER_QUIZ
+from results_log import ResultsLog
+from quiz_ui import FeedbackOverlay, BatchedRenderer
 
 # ----------------------------
 # SETUP PATHS (works inside folder)
@@ -13,6 +16,9 @@ correct_sound_path = os.path.join(script_dir, "correct.mp3")
 wrong_sound_path = os.path.join(script_dir, "wrong.mp3")
 gif_path = os.path.join(script_dir, "menu.gif")
 
+# Set QUIZ_PROFILE=1 to print per-answer UI latency on the results screen
+PROFILE_UI = os.environ.get("QUIZ_PROFILE") == "1"
+
 # ----------------------------
 # INITIALIZE PYGAME
 # ----------------------------
@@ -38,14 +44,17 @@ correct_sound = safe_load_sound(correct_sound_path)
 wrong_sound = safe_load_sound(wrong_sound_path)
 
 # ----------------------------
-# GLOBAL VARIABLES
+# QUIZ SESSION (created by start_quiz)
 # ----------------------------
-score = 0
-current_question = 0
-attempts = 0
-difficulty = 1
-num1, num2 = 0, 0
-operation = "+"
+session = None
+
+# Results history and leaderboards (stored next to this script)
+results_log = ResultsLog(script_dir)
+
+# Per-answer UI latency: seconds from Submit until Tk has redrawn the
+# quiz labels (taken after update_idletasks, see BatchedRenderer)
+answer_started = None
+answer_latencies = []
 
 # ----------------------------
 # GIF BACKGROUND FUNCTION
@@ -68,7 +77,7 @@ def load_gif_background_once(frame, gif_path, width, height):
     return label
 
 # ----------------------------
-# MODAL POPUP FUNCTION
+# FEEDBACK AND LABEL RENDERING (see quiz_ui.py)
 # ----------------------------
 def show_modal(message, color, sound=None):
     if sound:
@@ -76,13 +85,19 @@ def show_modal(message, color, sound=None):
             sound.play()
         except:
             pass
-    modal = tk.Toplevel(root)
-    modal.overrideredirect(True)
-    modal.geometry(f"400x100+{root.winfo_x()+100}+{root.winfo_y()+175}")
-    modal.config(bg="#1d4031")
-    tk.Label(modal, text=message, font=("Comic Sans MS", 18, "bold"),
-             fg=color, bg="#1d4031").pack(expand=True)
-    modal.after(1200, modal.destroy)
+    overlay.show(message, color)
+
+def render_quiz():
+    if not session.finished:
+        problem_label.config(text=session.problem_text)
+        question_label.config(text=f"Question: {session.current_question+1}/{QUESTIONS_PER_QUIZ}")
+        score_label.config(text=f"Score: {session.score}")
+
+def record_latency():
+    global answer_started
+    if answer_started is not None:
+        answer_latencies.append(time.perf_counter() - answer_started)
+        answer_started = None
 
 # ----------------------------
 # QUIZ FUNCTIONS
@@ -92,71 +107,54 @@ def display_menu():
     quiz_frame.pack_forget()
     result_frame.pack_forget()
 
-def random_numbers(level):
-    if level == 1:
-        return random.randint(0,9), random.randint(0,9)
-    elif level == 2:
-        return random.randint(10,99), random.randint(10,99)
-    else:
-        return random.randint(1000,9999), random.randint(1000,9999)
-
-def choose_operation():
-    return random.choice(["+", "-"])
-
 def show_problem():
-    global num1, num2, operation, attempts, current_question
-    if current_question >= 10:
+    if session.finished:
         show_results()
         return
-    num1, num2 = random_numbers(difficulty)
-    operation = choose_operation()
-    attempts = 0
-    problem_label.config(text=f"{num1} {operation} {num2} = ?")
-    question_label.config(text=f"Question: {current_question+1}/10")
-    score_label.config(text=f"Score: {score}")
     answer_entry.delete(0, tk.END)
+    renderer.request()
 
 def check_answer():
-    global score, attempts, current_question
+    global answer_started
     try:
         user = int(answer_entry.get())
     except:
         show_modal("Enter a valid number!", "#fa9876")
         return
 
-    correct = num1 + num2 if operation == "+" else num1 - num2
+    answer_started = time.perf_counter()
+    correct = session.correct_answer
+    outcome = session.submit(user)
 
-    if user == correct:
-        score += 10 if attempts == 0 else 5
+    if outcome == CORRECT:
         show_modal("✅ Correct!", "#00ff00", correct_sound)
-        current_question += 1
         show_problem()
+    elif outcome == TRY_AGAIN:
+        show_modal("❌ Wrong! Try again.", "#ff4500", wrong_sound)
+        renderer.request()
     else:
-        attempts += 1
-        if attempts < 2:
-            show_modal("❌ Wrong! Try again.", "#ff4500", wrong_sound)
-        else:
-            show_modal(f"❌ Wrong! Correct: {correct}", "#ff4500", wrong_sound)
-            current_question += 1
-            show_problem()
-
-    score_label.config(text=f"Score: {score}")
-    question_label.config(text=f"Question: {current_question+1}/10")
+        show_modal(f"❌ Wrong! Correct: {correct}", "#ff4500", wrong_sound)
+        show_problem()
 
 def show_results():
     quiz_frame.pack_forget()
     result_frame.pack(fill="both", expand=True)
-    if score>=90: grade="A+ 🎉"
-    elif score>=75: grade="A 👍"
-    elif score>=50: grade="B 🙂"
-    else: grade="C 😐"
-    result_label.config(text=f"Score: {score}/100\nGrade: {grade}")
+    result_text = f"Score: {session.score}/100\nGrade: {session.grade}"
+    result_label.config(text=result_text)
+    root.update_idletasks()
+    record_latency()
+    rank, total, percentile = results_log.add_session(session)
+    if total:
+        result_label.config(text=f"{result_text}\nRank: {rank} of {total} - percentile {percentile:.0f}")
+    if PROFILE_UI and answer_latencies:
+        average = sum(answer_latencies) / len(answer_latencies) * 1000
+        print(f"UI latency: {len(answer_latencies)} answers, "
+              f"avg {average:.2f} ms, max {max(answer_latencies)*1000:.2f} ms")
 
 def start_quiz(level):
-    global difficulty, score, current_question
-    difficulty = level
-    score=0
-    current_question=0
+    global session
+    session = QuizSession(level)
+    answer_latencies.clear()
     menu_frame.pack_forget()
     result_frame.pack_forget()
     quiz_frame.pack(fill="both", expand=True)
@@ -172,6 +170,8 @@ root = tk.Tk()
 root.title("Maths Quiz")
 root.geometry("600x450")
 root.resizable(False, False)
+overlay = FeedbackOverlay(root)
+renderer = BatchedRenderer(root, render_quiz, after_render=record_latency)
 
 # ----------------------------
 # FRAMES
@@ -226,9 +226,9 @@ tk.Button(quiz_frame,text="Submit",bg="#1d4031",fg="#fa9876",
 # ----------------------------
 # RESULT FRAME
 # ----------------------------
-result_label = tk.Label(result_frame,text="",font=("Comic Sans MS",24,"bold"),
+result_label = tk.Label(result_frame,text="",font=("Comic Sans MS",20,"bold"),
                         fg="#fa9876", bg="#1d4031")
-result_label.pack(pady=150)
+result_label.pack(pady=(110,20))
 tk.Button(result_frame,text="Play Again",bg="#1d4031",fg="#fa9876",
           font=("Comic Sans MS",14,"bold"), command=play_again).pack(pady=10)
 tk.Button(result_frame,text="Exit",bg="#1d4031",fg="#fa9876",
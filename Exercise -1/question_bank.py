@@ -0,0 +1,136 @@
+import argparse
+import time
+from functools import lru_cache
+
+import numpy as np
+
+# ----------------------------
+# OPERATIONS AND LEVELS
+# ----------------------------
+# Questions store an index into OPERATIONS instead of the symbol itself
+OPERATIONS = ("+", "-", "×", "÷")
+
+# Number range and allowed operations for each difficulty.
+# Change these with configure_level() so cached banks are rebuilt;
+# × and ÷ are off by default to match the original quiz.
+LEVELS = {
+    1: {"low": 0, "high": 9, "operations": ("+", "-")},
+    2: {"low": 10, "high": 99, "operations": ("+", "-")},
+    3: {"low": 1000, "high": 9999, "operations": ("+", "-")},
+}
+
+BANK_SIZE = 10_000
+# Most recently used banks kept in memory (about 250 KB each)
+BANK_CACHE_SIZE = 32
+
+# Questions are generated with int64 arithmetic
+INT64_MAX = np.iinfo(np.int64).max
+
+def check_range(low, high, operations):
+    """Raise ValueError if the answers for this range could overflow int64."""
+    largest = max(abs(low), abs(high))
+    if ("×" in operations or "÷" in operations) and largest ** 2 > INT64_MAX:
+        raise ValueError(f"range {low}..{high} is too large for × or ÷")
+    if largest * 2 > INT64_MAX:
+        raise ValueError(f"range {low}..{high} is too large for + or -")
+
+def configure_level(level, low, high, operations=("+", "-")):
+    """Set the number range and operations for a difficulty level.
+
+    For ÷ the divisor and the answer are drawn from [low, high] (divisors
+    below 1 are raised to 1), so the dividend shown can be as large as
+    high * high.
+    """
+    if not operations:
+        raise ValueError("at least one operation is required")
+    for op in operations:
+        if op not in OPERATIONS:
+            raise ValueError(f"unknown operation: {op!r}")
+    if low > high:
+        raise ValueError("low must not be greater than high")
+    if "÷" in operations and high < 1:
+        raise ValueError("division needs a range that contains a positive divisor")
+    check_range(low, high, operations)
+    LEVELS[level] = {"low": low, "high": high, "operations": tuple(operations)}
+
+# ----------------------------
+# VECTORISED GENERATOR
+# ----------------------------
+def generate_questions(count, low, high, operations, seed=None):
+    """Generate count questions in one NumPy pass.
+
+    Returns (num1, op_codes, num2, answers) arrays. Division questions
+    are built as (answer * divisor) ÷ divisor so they always have an
+    integer result and never divide by zero.
+    """
+    check_range(low, high, operations)
+    rng = np.random.default_rng(seed)
+    allowed = np.array([OPERATIONS.index(op) for op in operations], dtype=np.uint8)
+    op_codes = allowed[rng.integers(0, len(allowed), size=count)]
+    num1 = rng.integers(low, high, size=count, endpoint=True, dtype=np.int64)
+    num2 = rng.integers(low, high, size=count, endpoint=True, dtype=np.int64)
+
+    is_div = op_codes == OPERATIONS.index("÷")
+    if is_div.any():
+        divisors = rng.integers(max(low, 1), max(high, 1), size=count, endpoint=True, dtype=np.int64)
+        num2 = np.where(is_div, divisors, num2)
+
+    answers = np.select(
+        [op_codes == 0, op_codes == 1, op_codes == 2],
+        [num1 + num2, num1 - num2, num1 * num2],
+        default=num1,
+    )
+    num1 = np.where(is_div, num1 * num2, num1)
+    return num1, op_codes, num2, answers
+
+# ----------------------------
+# CACHED QUESTION BANK
+# ----------------------------
+class QuestionBank:
+    """A precomputed block of questions that quiz sessions index into."""
+    __slots__ = ("num1", "op_codes", "num2", "answers")
+
+    def __init__(self, num1, op_codes, num2, answers):
+        self.num1 = num1
+        self.op_codes = op_codes
+        self.num2 = num2
+        self.answers = answers
+
+    def __len__(self):
+        return len(self.answers)
+
+    def problem(self, index):
+        """Return (num1, operation, num2, answer) for a question as plain ints."""
+        index %= len(self.answers)
+        return (int(self.num1[index]), OPERATIONS[self.op_codes[index]],
+                int(self.num2[index]), int(self.answers[index]))
+
+@lru_cache(maxsize=BANK_CACHE_SIZE)
+def _build_bank(seed, low, high, operations, size):
+    return QuestionBank(*generate_questions(size, low, high, operations, seed))
+
+def get_bank(seed, level):
+    """Return the cached bank for (seed, level), building it on first use."""
+    config = LEVELS[level]
+    return _build_bank(seed, config["low"], config["high"], config["operations"], BANK_SIZE)
+
+# ----------------------------
+# BENCHMARK
+# ----------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the vectorised question generator.")
+    parser.add_argument("--count", type=int, default=5_000_000, help="questions to generate")
+    parser.add_argument("--level", type=int, default=1, choices=sorted(LEVELS), help="difficulty level")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--operations", default="+-×÷", help="operations to mix, e.g. +-×÷")
+    args = parser.parse_args()
+
+    config = LEVELS[args.level]
+    start = time.perf_counter()
+    generate_questions(args.count, config["low"], config["high"], tuple(args.operations), args.seed)
+    elapsed = time.perf_counter() - start
+    print(f"Generated {args.count:,} level {args.level} questions in {elapsed:.3f} s "
+          f"({args.count / elapsed:,.0f} questions/s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import random
+import time
+
+from question_bank import get_bank
+
+# ----------------------------
+# QUIZ RULES
+# ----------------------------
+QUESTIONS_PER_QUIZ = 10
+MAX_ATTEMPTS = 2
+FIRST_TRY_POINTS = 10
+SECOND_TRY_POINTS = 5
+
+# Outcomes returned by QuizSession.submit
+CORRECT = "correct"
+TRY_AGAIN = "try_again"
+WRONG = "wrong"
+
+DEFAULT_SEED = 2024
+
+# ----------------------------
+# GRADING
+# ----------------------------
+GRADES = ("A+ 🎉", "A 👍", "B 🙂", "C 😐")
+
+def grade_index(score):
+    if score>=90: return 0
+    elif score>=75: return 1
+    elif score>=50: return 2
+    else: return 3
+
+def grade_for(score):
+    return GRADES[grade_index(score)]
+
+# ----------------------------
+# QUIZ SESSION
+# ----------------------------
+class QuizSession:
+    """State of one quiz attempt, with no Tk dependency.
+
+    Questions come from a shared, cached QuestionBank for (seed, level);
+    a session only remembers where in the bank it started. __slots__
+    keeps each session small so one process can hold thousands of them
+    at once (e.g. one per student on a server).
+    """
+    __slots__ = ("difficulty", "bank", "start", "score", "current_question", "attempts",
+                 "question_started", "question_times")
+
+    def __init__(self, difficulty=1, seed=DEFAULT_SEED, start=None):
+        self.difficulty = difficulty
+        self.bank = get_bank(seed, difficulty)
+        self.start = random.randrange(len(self.bank)) if start is None else start
+        self.score = 0
+        self.current_question = 0
+        self.attempts = 0
+        self.question_started = time.perf_counter()
+        self.question_times = []
+
+    @property
+    def finished(self):
+        return self.current_question >= QUESTIONS_PER_QUIZ
+
+    @property
+    def problem(self):
+        """(num1, operation, num2, answer) for the current question."""
+        return self.bank.problem(self.start + self.current_question)
+
+    @property
+    def correct_answer(self):
+        return self.problem[3]
+
+    @property
+    def problem_text(self):
+        num1, operation, num2, _ = self.problem
+        return f"{num1} {operation} {num2} = ?"
+
+    @property
+    def grade(self):
+        return grade_for(self.score)
+
+    def submit(self, answer):
+        """Check an answer and advance the quiz.
+
+        Returns one of CORRECT, TRY_AGAIN or WRONG. After CORRECT or
+        WRONG the session has already moved on to the next question.
+        """
+        if self.finished:
+            raise RuntimeError("quiz is already finished")
+        if answer == self.correct_answer:
+            self.score += FIRST_TRY_POINTS if self.attempts == 0 else SECOND_TRY_POINTS
+            outcome = CORRECT
+        else:
+            self.attempts += 1
+            if self.attempts < MAX_ATTEMPTS:
+                return TRY_AGAIN
+            outcome = WRONG
+        now = time.perf_counter()
+        self.question_times.append(now - self.question_started)
+        self.question_started = now
+        self.current_question += 1
+        self.attempts = 0
+        return outcome
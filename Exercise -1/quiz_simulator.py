@@ -0,0 +1,53 @@
+import argparse
+import asyncio
+import random
+import time
+
+from question_bank import BANK_SIZE
+from quiz_engine import QuizSession
+
+# ----------------------------
+# SIMULATED STUDENT
+# ----------------------------
+async def simulated_student(session, accuracy, rng):
+    """Answer every question of one session, yielding to the event loop
+    after each answer like a real client connection would."""
+    answers = 0
+    while not session.finished:
+        answer = session.correct_answer
+        if rng.random() >= accuracy:
+            answer += 1
+        session.submit(answer)
+        answers += 1
+        await asyncio.sleep(0)
+    return answers
+
+async def run_classroom(num_sessions, accuracy, seed):
+    rng = random.Random(seed)
+    sessions = [QuizSession(rng.randint(1, 3), seed, rng.randrange(BANK_SIZE))
+                for _ in range(num_sessions)]
+    start = time.perf_counter()
+    counts = await asyncio.gather(*(simulated_student(s, accuracy, rng) for s in sessions))
+    elapsed = time.perf_counter() - start
+    return sessions, sum(counts), elapsed
+
+# ----------------------------
+# MAIN
+# ----------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Measure quiz engine throughput with many concurrent sessions.")
+    parser.add_argument("--sessions", type=int, default=5000, help="number of concurrent quiz sessions")
+    parser.add_argument("--accuracy", type=float, default=0.7, help="chance a simulated student answers correctly")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for reproducible runs")
+    args = parser.parse_args()
+
+    sessions, answers, elapsed = asyncio.run(run_classroom(args.sessions, args.accuracy, args.seed))
+    average = sum(s.score for s in sessions) / len(sessions)
+    print(f"Sessions:      {len(sessions)}")
+    print(f"Answers:       {answers}")
+    print(f"Elapsed:       {elapsed:.3f} s")
+    print(f"Throughput:    {answers / elapsed:,.0f} answers/s")
+    print(f"Average score: {average:.1f}/100")
+
+if __name__ == "__main__":
+    main()
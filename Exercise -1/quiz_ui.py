@@ -0,0 +1,69 @@
+import tkinter as tk
+
+# ----------------------------
+# FEEDBACK OVERLAY
+# ----------------------------
+MODAL_DURATION = 1200
+
+class FeedbackOverlay:
+    """One borderless window, created up front and reused for every message.
+
+    A new message replaces the one on screen straight away and restarts the
+    hide timer, so feedback always belongs to the answer just submitted.
+    """
+
+    def __init__(self, root, duration=MODAL_DURATION, bg="#1d4031"):
+        self.root = root
+        self.duration = duration
+        self.window = tk.Toplevel(root)
+        self.window.overrideredirect(True)
+        self.window.config(bg=bg)
+        self.label = tk.Label(self.window, font=("Comic Sans MS", 18, "bold"), bg=bg)
+        self.label.pack(expand=True)
+        self.window.withdraw()
+        self.timer = None
+
+    def show(self, message, color):
+        self.label.config(text=message, fg=color)
+        if self.timer is None:
+            self.window.geometry(f"400x100+{self.root.winfo_x()+100}+{self.root.winfo_y()+175}")
+            self.window.deiconify()
+            self.window.lift()
+        else:
+            self.window.after_cancel(self.timer)
+        self.timer = self.window.after(self.duration, self.hide)
+
+    def hide(self):
+        if self.timer is not None:
+            self.window.after_cancel(self.timer)
+            self.timer = None
+        self.window.withdraw()
+
+# ----------------------------
+# BATCHED LABEL UPDATES
+# ----------------------------
+class BatchedRenderer:
+    """Calls render once when Tk is idle, however many times request() was
+    called before that, so each answer reconfigures the labels only once.
+
+    after_render (optional) runs after update_idletasks(), i.e. once Tk
+    has redrawn the changed widgets.
+    """
+
+    def __init__(self, root, render, after_render=None):
+        self.root = root
+        self.render = render
+        self.after_render = after_render
+        self.pending = False
+
+    def request(self):
+        if not self.pending:
+            self.pending = True
+            self.root.after_idle(self._run)
+
+    def _run(self):
+        self.pending = False
+        self.render()
+        self.root.update_idletasks()
+        if self.after_render:
+            self.after_render()
@@ -0,0 +1,155 @@
+import heapq
+import json
+import os
+import struct
+import time
+
+from quiz_engine import QUESTIONS_PER_QUIZ, grade_index
+
+# ----------------------------
+# RECORD FORMAT
+# ----------------------------
+# One fixed-size binary record per finished quiz:
+#   timestamp (float64), difficulty, score, grade index (uint8 each),
+#   then the time spent on each question in milliseconds (uint16 each).
+RECORD = struct.Struct(f"<dBBB{QUESTIONS_PER_QUIZ}H")
+MAX_SCORE = 100
+TOP_K = 10
+
+def _empty_stats():
+    return {"count": 0, "total": 0, "histogram": [0] * (MAX_SCORE + 1), "top": []}
+
+# ----------------------------
+# RESULTS LOG
+# ----------------------------
+class ResultsLog:
+    """Append-only log of quiz results with per-difficulty leaderboards.
+
+    Every difficulty keeps a running count/total, a score histogram and
+    a bounded top-K min-heap. These are updated as results are added and
+    saved next to the log, so rank and percentile never need a rescan.
+    If the saved index doesn't match the log (missing or out of date) it
+    is rebuilt from the log once on startup.
+    """
+
+    def __init__(self, directory, name="quiz_results", top_k=TOP_K):
+        self.log_path = os.path.join(directory, name + ".log")
+        self.index_path = os.path.join(directory, name + "_index.json")
+        self.top_k = top_k
+        self.records = 0
+        self.stats = {}
+        self._load_index()
+
+    # ---- index persistence ----
+    def _load_index(self):
+        log_records = self._trim_log()
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as file:
+                index = json.load(file)
+            if index["records"] == log_records and index["top_k"] == self.top_k:
+                self.records = index["records"]
+                self.stats = {int(level): stats for level, stats in index["stats"].items()}
+                return
+        except (OSError, ValueError, KeyError):
+            pass
+        self._rebuild_index()
+
+    def _trim_log(self):
+        """Drop a partial trailing record (e.g. from an interrupted write) so
+        later appends stay aligned. Returns the number of whole records."""
+        if not os.path.exists(self.log_path):
+            return 0
+        size = os.path.getsize(self.log_path)
+        usable = size - size % RECORD.size
+        if usable != size:
+            try:
+                os.truncate(self.log_path, usable)
+            except OSError as error:
+                print(f"Warning: could not repair {self.log_path}: {error}")
+        return usable // RECORD.size
+
+    def _rebuild_index(self):
+        self.records = 0
+        self.stats = {}
+        try:
+            with open(self.log_path, "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            data = b""
+        except OSError as error:
+            print(f"Warning: could not read {self.log_path}: {error}")
+            data = b""
+        usable = len(data) - len(data) % RECORD.size
+        for timestamp, difficulty, score, _, *_ in RECORD.iter_unpack(data[:usable]):
+            self._add_to_index(difficulty, score, timestamp)
+        self._save_index()
+
+    def _save_index(self):
+        index = {"records": self.records, "top_k": self.top_k, "stats": self.stats}
+        tmp_path = self.index_path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                json.dump(index, file)
+            os.replace(tmp_path, self.index_path)
+        except OSError as error:
+            print(f"Warning: could not save {self.index_path}: {error}")
+
+    def _add_to_index(self, difficulty, score, timestamp):
+        stats = self.stats.setdefault(difficulty, _empty_stats())
+        stats["count"] += 1
+        stats["total"] += score
+        stats["histogram"][score] += 1
+        # Min-heap of [score, -timestamp]: on a tie the earlier result stays
+        entry = [score, -timestamp]
+        if len(stats["top"]) < self.top_k:
+            heapq.heappush(stats["top"], entry)
+        elif entry > stats["top"][0]:
+            heapq.heapreplace(stats["top"], entry)
+        self.records += 1
+
+    # ---- public API ----
+    def add(self, difficulty, score, question_times, timestamp=None):
+        """Append a finished quiz and return (rank, total, percentile).
+
+        If the log can't be written a warning is printed and (0, 0, 0.0)
+        is returned, since this attempt isn't part of any ranking.
+        """
+        if not 0 <= score <= MAX_SCORE:
+            raise ValueError(f"score must be between 0 and {MAX_SCORE}, got {score}")
+        if timestamp is None:
+            timestamp = time.time()
+        millis = [min(int(t * 1000), 0xFFFF) for t in question_times]
+        millis += [0] * (QUESTIONS_PER_QUIZ - len(millis))
+        record = RECORD.pack(timestamp, difficulty, score, grade_index(score), *millis[:QUESTIONS_PER_QUIZ])
+        try:
+            with open(self.log_path, "ab") as file:
+                file.write(record)
+        except OSError as error:
+            print(f"Warning: could not write {self.log_path}: {error}")
+            return 0, 0, 0.0
+        self._add_to_index(difficulty, score, timestamp)
+        self._save_index()
+        return self.standing(difficulty, score)
+
+    def add_session(self, session):
+        return self.add(session.difficulty, session.score, session.question_times)
+
+    def standing(self, difficulty, score):
+        """Rank of a score among all attempts at this difficulty and the
+        percentage of attempts it scored at least as well as."""
+        stats = self.stats.get(difficulty)
+        if not stats:
+            return 1, 0, 100.0
+        histogram = stats["histogram"]
+        rank = 1 + sum(histogram[score + 1:])
+        percentile = 100.0 * sum(histogram[:score + 1]) / stats["count"]
+        return rank, stats["count"], percentile
+
+    def leaderboard(self, difficulty):
+        """Top-K (score, timestamp) pairs for a difficulty, best first."""
+        top = self.stats.get(difficulty, _empty_stats())["top"]
+        return [(score, -neg_time) for score, neg_time in sorted(top, reverse=True)]
+
+    def average(self, difficulty):
+        stats = self.stats.get(difficulty)
+        return stats["total"] / stats["count"] if stats else 0.0
@@ -0,0 +1,54 @@
+import unittest
+
+from quiz_engine import (QuizSession, CORRECT, TRY_AGAIN, WRONG, QUESTIONS_PER_QUIZ,
+                         FIRST_TRY_POINTS, SECOND_TRY_POINTS, grade_for)
+
+def wrong_answer(session):
+    return session.correct_answer + 1
+
+class QuizSessionTest(unittest.TestCase):
+    def setUp(self):
+        self.session = QuizSession(1, seed=0, start=0)
+
+    def test_first_try_scores_full_points(self):
+        self.assertEqual(self.session.submit(self.session.correct_answer), CORRECT)
+        self.assertEqual(self.session.score, FIRST_TRY_POINTS)
+        self.assertEqual(self.session.current_question, 1)
+
+    def test_second_try_scores_half_points(self):
+        self.assertEqual(self.session.submit(wrong_answer(self.session)), TRY_AGAIN)
+        self.assertEqual(self.session.current_question, 0)
+        self.assertEqual(self.session.submit(self.session.correct_answer), CORRECT)
+        self.assertEqual(self.session.score, SECOND_TRY_POINTS)
+        self.assertEqual(self.session.attempts, 0)
+
+    def test_wrong_after_max_attempts_scores_nothing(self):
+        first_problem = self.session.problem
+        self.assertEqual(self.session.submit(wrong_answer(self.session)), TRY_AGAIN)
+        self.assertEqual(self.session.submit(wrong_answer(self.session)), WRONG)
+        self.assertEqual(self.session.score, 0)
+        self.assertEqual(self.session.current_question, 1)
+        self.assertNotEqual(self.session.problem, first_problem)
+
+    def test_finishes_after_all_questions(self):
+        for _ in range(QUESTIONS_PER_QUIZ):
+            self.assertFalse(self.session.finished)
+            self.session.submit(self.session.correct_answer)
+        self.assertTrue(self.session.finished)
+        self.assertEqual(self.session.score, 100)
+        self.assertEqual(len(self.session.question_times), QUESTIONS_PER_QUIZ)
+        with self.assertRaises(RuntimeError):
+            self.session.submit(0)
+
+    def test_same_seed_and_start_give_same_questions(self):
+        other = QuizSession(1, seed=0, start=0)
+        self.assertEqual(other.problem, self.session.problem)
+
+    def test_grades(self):
+        self.assertTrue(grade_for(100).startswith("A+"))
+        self.assertTrue(grade_for(75).startswith("A "))
+        self.assertTrue(grade_for(50).startswith("B"))
+        self.assertTrue(grade_for(45).startswith("C"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import os
+import tempfile
+import unittest
+
+from quiz_engine import QUESTIONS_PER_QUIZ
+from results_log import ResultsLog, RECORD
+
+TIMES = [1.0] * QUESTIONS_PER_QUIZ
+
+class ResultsLogTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.directory = self.tmp.name
+
+    def test_rank_and_percentile(self):
+        log = ResultsLog(self.directory)
+        log.add(1, 50, TIMES)
+        log.add(1, 90, TIMES)
+        rank, total, percentile = log.add(1, 70, TIMES)
+        self.assertEqual((rank, total), (2, 3))
+        self.assertAlmostEqual(percentile, 200 / 3)
+        self.assertEqual(log.standing(1, 90)[0], 1)
+
+    def test_index_survives_reload(self):
+        log = ResultsLog(self.directory)
+        log.add(1, 80, TIMES, timestamp=1.0)
+        log.add(2, 60, TIMES, timestamp=2.0)
+        reloaded = ResultsLog(self.directory)
+        self.assertEqual(reloaded.stats, log.stats)
+        self.assertEqual(reloaded.leaderboard(2), [(60, 2.0)])
+
+    def test_stale_index_is_rebuilt(self):
+        log = ResultsLog(self.directory)
+        log.add(1, 80, TIMES)
+        with open(log.index_path, "w", encoding="utf-8") as file:
+            file.write('{"records": 0, "top_k": 10, "stats": {}}')
+        reloaded = ResultsLog(self.directory)
+        self.assertEqual(reloaded.records, 1)
+        self.assertEqual(reloaded.standing(1, 80), (1, 1, 100.0))
+
+    def test_partial_record_is_trimmed(self):
+        log = ResultsLog(self.directory)
+        log.add(1, 90, TIMES)
+        with open(log.log_path, "ab") as file:
+            file.write(b"xx")
+        log = ResultsLog(self.directory)
+        log.add(2, 80, TIMES)
+        self.assertEqual(os.path.getsize(log.log_path), 2 * RECORD.size)
+        os.remove(log.index_path)
+        self.assertEqual(sorted(ResultsLog(self.directory).stats), [1, 2])
+
+    def test_top_k_keeps_earliest_on_ties(self):
+        log = ResultsLog(self.directory, top_k=2)
+        log.add(1, 100, TIMES, timestamp=1.0)
+        log.add(1, 100, TIMES, timestamp=2.0)
+        log.add(1, 100, TIMES, timestamp=3.0)
+        log.add(1, 40, TIMES, timestamp=4.0)
+        self.assertEqual(log.leaderboard(1), [(100, 1.0), (100, 2.0)])
+
+    def test_invalid_score_is_not_written(self):
+        log = ResultsLog(self.directory)
+        with self.assertRaises(ValueError):
+            log.add(1, 101, TIMES)
+        self.assertFalse(os.path.exists(log.log_path))
+
+    def test_unwritable_log_gives_no_rank(self):
+        log = ResultsLog(os.path.join(self.directory, "missing"))
+        self.assertEqual(log.add(1, 50, TIMES), (0, 0, 0.0))
+
+if __name__ == "__main__":
+    unittest.main()
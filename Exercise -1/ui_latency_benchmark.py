@@ -0,0 +1,124 @@
+import argparse
+import time
+import tkinter as tk
+
+from quiz_engine import QuizSession, QUESTIONS_PER_QUIZ
+from quiz_ui import FeedbackOverlay, BatchedRenderer
+
+# ----------------------------
+# SHARED QUIZ WIDGETS
+# ----------------------------
+# Mirrors the quiz frame of Mathquiz.py without images or sound. The old
+# path is reproduced below; the pooled path uses quiz_ui, the same code
+# Mathquiz.py runs. Needs a display (or xvfb-run).
+def build_quiz_frame(root):
+    frame = tk.Frame(root, width=600, height=450, bg="#1d4031")
+    frame.pack(fill="both", expand=True)
+    labels = {}
+    for name in ("question", "score", "problem"):
+        labels[name] = tk.Label(frame, text="", font=("Comic Sans MS", 16, "bold"),
+                                fg="#fa9876", bg="#1d4031")
+        labels[name].pack(pady=5)
+    entry = tk.Entry(frame, font=("Comic Sans MS", 16, "bold"))
+    entry.pack(pady=10)
+    return labels, entry
+
+def configure_labels(labels, session):
+    labels["problem"].config(text=session.problem_text)
+    labels["question"].config(text=f"Question: {session.current_question+1}/{QUESTIONS_PER_QUIZ}")
+    labels["score"].config(text=f"Score: {session.score}")
+
+# ----------------------------
+# BASELINE PATH
+# ----------------------------
+# New Toplevel per answer and the labels configured twice per answer.
+def baseline_answer(root, labels, entry, session, answer):
+    session.submit(answer)
+    modal = tk.Toplevel(root)
+    modal.overrideredirect(True)
+    modal.geometry(f"400x100+{root.winfo_x()+100}+{root.winfo_y()+175}")
+    modal.config(bg="#1d4031")
+    tk.Label(modal, text="✅ Correct!", font=("Comic Sans MS", 18, "bold"),
+             fg="#00ff00", bg="#1d4031").pack(expand=True)
+    modal.after(1200, modal.destroy)
+    if not session.finished:
+        configure_labels(labels, session)
+        entry.delete(0, tk.END)
+    labels["score"].config(text=f"Score: {session.score}")
+    labels["question"].config(text=f"Question: {session.current_question+1}/{QUESTIONS_PER_QUIZ}")
+
+# ----------------------------
+# POOLED PATH
+# ----------------------------
+class PooledUI:
+    """The Mathquiz.py check_answer flow on top of quiz_ui."""
+
+    def __init__(self, root, labels, entry):
+        self.entry = entry
+        self.session = None
+        self.overlay = FeedbackOverlay(root)
+        self.renderer = BatchedRenderer(root, self.render)
+        self.labels = labels
+
+    def render(self):
+        if not self.session.finished:
+            configure_labels(self.labels, self.session)
+
+    def answer(self, session, answer):
+        self.session = session
+        session.submit(answer)
+        self.overlay.show("✅ Correct!", "#00ff00")
+        if not session.finished:
+            self.entry.delete(0, tk.END)
+        self.renderer.request()
+
+# ----------------------------
+# TIMING
+# ----------------------------
+def time_answers(root, count, answer_once):
+    """Submit-to-labels-updated time for each answer, in milliseconds.
+
+    Both paths are timed the same way: submit, then root.update() so all
+    pending idle work (including label redraws) has run."""
+    latencies = []
+    session = QuizSession(1, start=0)
+    for _ in range(count):
+        if session.finished:
+            session = QuizSession(1, start=0)
+        start = time.perf_counter()
+        answer_once(session, session.correct_answer)
+        root.update()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+def summary(name, latencies):
+    ordered = sorted(latencies)
+    average = sum(ordered) / len(ordered)
+    p95 = ordered[int(len(ordered) * 0.95)]
+    print(f"{name:<9} avg {average:.3f} ms   p95 {p95:.3f} ms   max {ordered[-1]:.3f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare per-answer UI latency of the old and pooled quiz UI.")
+    parser.add_argument("--answers", type=int, default=200, help="answers to submit per path")
+    args = parser.parse_args()
+
+    root = tk.Tk()
+    root.geometry("600x450")
+    labels, entry = build_quiz_frame(root)
+    root.update()
+
+    baseline = time_answers(root, args.answers,
+                            lambda session, answer: baseline_answer(root, labels, entry, session, answer))
+    # Let the stacked baseline windows close before timing the pooled path
+    root.after(1300, root.quit)
+    root.mainloop()
+
+    pooled_ui = PooledUI(root, labels, entry)
+    pooled = time_answers(root, args.answers, pooled_ui.answer)
+
+    summary("Baseline:", baseline)
+    summary("Pooled:", pooled)
+    root.destroy()
+
+if __name__ == "__main__":
+    main()